@@ -36,7 +36,7 @@ experiment.execute()
 run_id = experiment.executions[0].run[0].id
 output_id = ""
 
-for output_pipline in app._pipeline_output_app.list():
+for output_pipline in app.pipeline_outputs.list():
     if output_pipline.parent.id == run_id:
         output_id = output_pipline.id
 
@@ -1,3 +1,5 @@
+from itertools import islice
+
 from pypadre.app import p_app
 from pypadre.core.events import add_logger
 from pypadre.core.model.experiment import Experiment
@@ -9,7 +11,9 @@ def create_test_pipeline():
     from sklearn.pipeline import Pipeline
     from sklearn.svm import SVC
     # estimators = [('reduce_dim', PCA()), ('clf', SVC())]
-    estimators = [('SVC', SVC(probability=True))]
+    # probability=True would run an internal 5-fold Platt scaling on every fit;
+    # the evaluator skips probability output when the flag is off
+    estimators = [('SVC', SVC(probability=False))]
     return Pipeline(estimators)
 
 
@@ -18,7 +22,7 @@ def main():
     logger = PadreLogger()
     logger.backend = p_app.repository
     add_logger(logger=logger)
-    ds = [i for i in load_sklearn_toys()][2]
+    ds = next(islice(load_sklearn_toys(), 2, None))
     ex = Experiment(name="Test Experiment SVM",
                         description="Testing Support Vector Machines via SKLearn Pipeline",
                         dataset=ds,
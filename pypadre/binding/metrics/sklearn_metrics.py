@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Optional, List
 
 import numpy as np
@@ -37,9 +36,6 @@ def matrix(ctx, **kwargs) -> Optional[Metric]:
             :param computation: The computation which is the input for confusion matrix calculation. Has to hold truth and predicted values.
             :return: The confusion matrix
             """
-    import copy
-    # import the constant strings that are the dictionary keys from the evaluator component
-    from pypadre.core.model.pipeline.components.component_mixins import EvaluatorComponentMixin
     (computation,) = unpack(ctx, "computation")
 
     # create the predicted values and the truth values array from the computation results
@@ -78,7 +74,7 @@ def matrix(ctx, **kwargs) -> Optional[Metric]:
         for idx in range(0, len(truth)):
             confusion_matrix[int(truth[idx])][int(predicted[idx])] += 1
 
-    return Metric(name=CONFUSION_MATRIX, computation=computation, result=copy.deepcopy(confusion_matrix.tolist()))
+    return Metric(name=CONFUSION_MATRIX, computation=computation, result=confusion_matrix.tolist())
 
 
 class ConfusionMatrix(MetricProviderMixin):
@@ -136,7 +132,7 @@ def regression(ctx, **kwargs) -> Optional[Metric]:
     regression_metrics[STANDARD_DEVIATION] = float(np.std(error))
     regression_metrics[MAX_ABSOLUTE_ERROR] = float(np.max(abs(error)))
     regression_metrics[MIN_ABSOLUTE_ERROR] = float(np.min(abs(error)))
-    return Metric(name=REGRESSION_METRICS, computation=computation, result=deepcopy(regression_metrics))
+    return Metric(name=REGRESSION_METRICS, computation=computation, result=regression_metrics)
 
 
 class RegressionMetrics(MetricProviderMixin):
@@ -205,7 +201,7 @@ def classification(ctx, option='macro', **kwargs):
         classification_metrics[ACCURACY] = accuracy
         classification_metrics[F1_SCORE] = f1_measure.tolist()
 
-    return Metric(name=CLASSIFICATION_METRICS, computation=computation, result=deepcopy(classification_metrics))
+    return Metric(name=CLASSIFICATION_METRICS, computation=computation, result=classification_metrics)
 
 
 class ClassificationMetrics(MetricProviderMixin):
@@ -1,4 +1,4 @@
-from collections import Callable
+from collections.abc import Callable
 from typing import Union, Type, Optional
 
 from sklearn.pipeline import Pipeline
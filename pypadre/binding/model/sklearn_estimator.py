@@ -8,6 +8,7 @@ from pypadre.core.model.generic.custom_code import ProvidedCodeHolderMixin
 from pypadre.core.model.pipeline.components.component_mixins import EstimatorComponentMixin, \
     ParameterizedPipelineComponentMixin
 from pypadre.core.util.utils import unpack
+from pypadre.core.visitors.mappings import name_mappings, alternate_name_mappings
 
 
 def is_sklearn_pipeline(pipeline):
@@ -47,6 +48,15 @@ class SKLearnEstimator(ProvidedCodeHolderMixin, EstimatorComponentMixin, Paramet
             raise ValueError("SKLearnEstimator needs a delegate defined as sklearn.pipeline")
         self._pipeline = pipeline
 
+        # Maps estimator name -> {parameter name: parameter path}, built lazily from the mappings file
+        self._parameter_paths = {}
+
+        # The capabilities of the delegate pipeline are static, so the attribute lookups are done
+        # once here instead of on every call
+        self._inferencer = getattr(pipeline, "predict", None)
+        self._scorer = getattr(pipeline, "score", None)
+        self._transformer = getattr(pipeline, "transform", None)
+
         super().__init__(name="SKLearnEstimator", fn=self.call, parameter_provider=parameter_provider, **kwargs)
 
     def call(self, ctx, **kwargs):
@@ -55,7 +65,7 @@ class SKLearnEstimator(ProvidedCodeHolderMixin, EstimatorComponentMixin, Paramet
 
         self.set_parameter_values(parameters=kwargs)
 
-        self.send_start(message="Starting phase sklearn." + phases.fitting)
+        self.send_start(message=f"Starting phase sklearn.{phases.fitting}")
         y = None
         if split.train_targets is not None:
             y = split.train_targets.reshape((len(split.train_targets),))
@@ -64,7 +74,7 @@ class SKLearnEstimator(ProvidedCodeHolderMixin, EstimatorComponentMixin, Paramet
             # Create dummy target of zeros if target is not present.
             y = np.zeros(shape=(len(split.train_features, )))
         self._pipeline.fit(split.train_features, y)
-        self.send_stop(message='Stopping phase sklearn.' + phases.fitting)
+        self.send_stop(message=f"Stopping phase sklearn.{phases.fitting}")
         if self.is_scorer():
             self.send_start(message="Starting phase sklearn.scoring.trainset")
             score = self._pipeline.score(split.train_features, y)
@@ -85,13 +95,13 @@ class SKLearnEstimator(ProvidedCodeHolderMixin, EstimatorComponentMixin, Paramet
         return SciKitVisitor(self._pipeline)
 
     def is_inferencer(self):
-        return getattr(self._pipeline, "predict", None)
+        return self._inferencer
 
     def is_scorer(self):
-        return getattr(self._pipeline, "score", None)
+        return self._scorer
 
     def is_transformer(self):
-        return getattr(self._pipeline, "transform", None)
+        return self._transformer
 
     @property
     def pipeline(self):
@@ -99,7 +109,11 @@ class SKLearnEstimator(ProvidedCodeHolderMixin, EstimatorComponentMixin, Paramet
 
     def set_parameter_values(self, parameters):
 
-        for parameter in parameters:
+        # Group the resolved parameter paths by estimator so set_params runs once per estimator
+        # instead of once per parameter
+        pending = dict()
+
+        for parameter, value in parameters.items():
             # split_params[0] will be the name of the estimator
             # split_params[1] will be the name of the parameter
             split_params = parameter.split(sep='.')
@@ -125,18 +139,22 @@ class SKLearnEstimator(ProvidedCodeHolderMixin, EstimatorComponentMixin, Paramet
 
             assert (parameter_name is not None)
 
-            estimator.set_params(**{parameter_path: parameters[parameter]})
+            entry = pending.get(estimator_name)
+            if entry is None:
+                pending[estimator_name] = (estimator, {parameter_path: value})
+            else:
+                entry[1][parameter_path] = value
+
+        for estimator, params in pending.values():
+            estimator.set_params(**params)
 
     def find_estimator_name_in_mapping(self, name):
         # This function is used to return the actual estimator name as specified in the mappings file
         # Estimators might have alternate names and users might specify the estimators using the alternate names
         # So to find the valid parameters, we need to find the estimator name as specified in the mappings file
-        from pypadre.core.visitors.mappings import alternate_name_mappings
         return alternate_name_mappings.get(name.lower())
 
     def get_parameter_path(self, estimator_name, parameter_name):
-        from pypadre.core.visitors.mappings import name_mappings
-
         # If the alternate estimator name is given, convert the alternate estimator name
         # to actual estimator name
         if name_mappings.get(estimator_name, None) is None:
@@ -145,18 +163,18 @@ class SKLearnEstimator(ProvidedCodeHolderMixin, EstimatorComponentMixin, Paramet
         else:
             estimator = estimator_name
 
-        parameters = name_mappings.get(estimator).get('hyper_parameters').get('model_parameters')
+        # Build the parameter name -> path table once per estimator instead of scanning the
+        # model_parameters list on every lookup
+        paths = self._parameter_paths.get(estimator)
+        if paths is None:
+            parameters = name_mappings.get(estimator).get('hyper_parameters').get('model_parameters')
+            paths = {parameter.get('name'): parameter.get('scikit-learn').get('path')
+                     for parameter in parameters}
+            self._parameter_paths[estimator] = paths
 
-        # If the parameter name matches return the path of the parameter
-        for parameter in parameters:
-            if parameter.get('name') == parameter_name:
-                return parameter.get('scikit-learn').get('path')
-
-        return None
+        return paths.get(parameter_name)
 
     def get_initial_hyperparameters(self):
-        from pypadre.core.visitors.mappings import name_mappings
-
         hyperparameter_dict = dict()
 
         for estimator_name in self.pipeline.named_steps:
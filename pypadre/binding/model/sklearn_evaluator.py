@@ -7,7 +7,7 @@ from pypadre.core.model.pipeline.components.component_mixins import EvaluatorCom
     ParameterizedPipelineComponentMixin
 from pypadre.core.ontology.padre_ontology import PaDREOntology
 from pypadre.core.util.utils import unpack
-from pypadre.core.visitors.mappings import name_mappings, alternate_name_mappings
+from pypadre.core.visitors.mappings import name_mappings, alternate_name_mappings, classification_estimators
 
 # Constant strings that are used in creating the results dictionary
 DATASET_NAME = 'dataset'
@@ -41,7 +41,7 @@ class SKLearnEvaluator(ProvidedCodeHolderMixin, EvaluatorComponentMixin, Paramet
 
         self.send_error(message="Test set is missing.", condition=not split.has_testset())
 
-        self.send_start(message="Starting phase sklearn." + phases.inferencing)
+        self.send_start(message=f"Starting phase sklearn.{phases.inferencing}")
         train_idx = train_idx.tolist()
         test_idx = test_idx.tolist()
 
@@ -49,33 +49,38 @@ class SKLearnEvaluator(ProvidedCodeHolderMixin, EvaluatorComponentMixin, Paramet
         y = split.test_targets.reshape((len(split.test_targets),))
 
         y_predicted = np.asarray(model.predict(split.test_features))
-        self.send_stop(message="Stopping phase sklearn." + phases.inferencing)
+        self.send_stop(message=f"Stopping phase sklearn.{phases.inferencing}")
 
         self.send_info(mode='probability', pred=y_predicted, truth=y,
                       message="Checking if the workflow supports probability computation or not.")
 
+        final_estimator_name, final_estimator = model.steps[-1]
+
         # Check if the final estimator has an attribute called probability and if it has check if it is True
         compute_probabilities = True
-        if hasattr(model.steps[-1][1], 'probability') and not model.steps[-1][1].probability:
+        if hasattr(final_estimator, 'probability') and not final_estimator.probability:
             compute_probabilities = False
 
         # log the probabilities of the result too if the method is present
 
-        final_estimator_name = model.steps[-1][0]
-        if name_mappings.get(final_estimator_name) is None:
+        resolved_name = final_estimator_name
+        mapping = name_mappings.get(final_estimator_name)
+        if mapping is None:
             # If estimator name is not present in name mappings check whether it is present in alternate names
-            estimator = alternate_name_mappings.get(str(final_estimator_name).lower())
-            final_estimator_type = name_mappings.get(estimator).get('type')
-        else:
-            final_estimator_type = name_mappings.get(model.steps[-1][0]).get('type')
+            resolved_name = alternate_name_mappings.get(str(final_estimator_name).lower())
+            mapping = name_mappings.get(resolved_name)
+        final_estimator_type = mapping.get('type') if mapping is not None else None
 
         y_predicted_probabilities = None
 
         self.send_error(condition=final_estimator_type is None,
                         message='Final estimator could not be found in names or alternate names')
 
-        if final_estimator_type == 'Classification' or \
-                (final_estimator_type == 'Neural Network' and np.all(np.mod(y_predicted, 1)) == 0):
+        # An integral dtype cannot hold continuous predictions, so the modulo scan over the
+        # whole prediction array is only needed for floating point outputs
+        if resolved_name in classification_estimators or \
+                (final_estimator_type == 'Neural Network' and
+                 (y_predicted.dtype.kind in 'iu' or np.all(np.mod(y_predicted, 1)) == 0)):
             type_ = PaDREOntology.SubClassesExperiment.Classification.value
 
             if compute_probabilities:
@@ -118,7 +123,6 @@ class SKLearnEvaluator(ProvidedCodeHolderMixin, EvaluatorComponentMixin, Paramet
     @staticmethod
     def create_results_dictionary(*, split_num: int, train_idx: list, test_idx: list, dataset: str, type_: str,
                                   truth: list, predicted: list, probabilities: list):
-        from pypadre.core.model.pipeline.components.component_mixins import EvaluatorComponentMixin
         results = dict()
         results[DATASET_NAME] = dataset
         results[TRAINING_SAMPLES] = len(train_idx)
@@ -1,22 +1,20 @@
+import itertools
+
 from pypadre import _version, _name
 from pypadre.core.model.code.code_mixin import PythonPackage, PipIdentifier, Function
 from pypadre.core.model.pipeline.parameter_providers.parameters import ParameterProvider
 
 
 def _create_combinations(ctx, **parameters: dict):
-    import itertools
-
     # Generate every possible combination of the provided hyper parameters.
     master_list = []
     params_list = []
-    for estimator in parameters:
-        param_dict = parameters.get(estimator)
+    for estimator, param_dict in parameters.items():
         # assert_condition(condition=isinstance(param_dict, dict),
         #                  source=self,
         #                  source=self,
         #                  message='Parameter dictionary is not of type dictionary for estimator:' + estimator)
-        for params in param_dict:
-            param = param_dict.get(params)
+        for params, param in param_dict.items():
             if not isinstance(param, list):
                 param = [param]
             # Append only the parameters to create a master list
@@ -24,7 +22,7 @@ def _create_combinations(ctx, **parameters: dict):
 
             # Append the estimator name followed by the parameter to create a ordered list.
             # Ordering of estimator.parameter corresponds to the value in the resultant grid tuple
-            params_list.append(''.join([estimator, '.', params]))
+            params_list.append(f'{estimator}.{params}')
 
     grid = itertools.product(*master_list)
     return grid, params_list
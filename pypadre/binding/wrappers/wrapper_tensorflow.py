@@ -1,4 +1,4 @@
-import copy
+import functools
 import importlib
 import json
 
@@ -8,6 +8,22 @@ import numpy as np
 # Todo version number??? Use version file.
 __version__ = "0.0.0"
 
+
+@functools.lru_cache(maxsize=1)
+def _load_framework_dict():
+    # The mapping file is static input; parse it once instead of per wrapper instance
+    with open('mappings_tensorflow.json') as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_class(path):
+    # The paths come from the static mapping file, so the split and import happen
+    # once per class no matter how many wrappers or layers are built
+    split_idx = path.rfind('.')
+    module = importlib.import_module(path[:split_idx])
+    return getattr(module, path[split_idx + 1:])
+
 class WrapperTensorFlow:
     """
     This class wraps the whole Tensorflow network and exposes an easy to use interface to the user
@@ -50,15 +66,16 @@ class WrapperTensorFlow:
         :param params: Parameters of the network, shape of the network
         """
 
-        with open('mappings_tensorflow.json') as f:
-            framework_dict = json.load(f)
+        framework_dict = _load_framework_dict()
 
         self.layers_dict = framework_dict.get('layers', None)
 
         if self.layers_dict is None:
             return
 
-        self.params = copy.deepcopy(params)
+        # A shallow copy is enough to decouple the wrapper from the caller's dict;
+        # the nested values are only ever read, never mutated.
+        self.params = dict(params)
         self.steps = params.get('steps', 1000)
         self.checkpoint = params.get('checkpoint', self.steps)
         self.batch_size = params.get('batch_size', 1)
@@ -194,7 +211,6 @@ class WrapperTensorFlow:
         result = x
 
         for layer in self.model:
-            print(layer)
             result = layer(result)
 
         return result
@@ -278,7 +294,6 @@ class WrapperTensorFlow:
         curr_params = dict()
         for param in params:
             param_value = layer_params.get(param, None)
-            print(param)
             if param_value is None and params.get(param).get('optional') is False:
                 curr_params = None
                 break
@@ -289,14 +304,10 @@ class WrapperTensorFlow:
 
         obj = None
         if curr_params is not None:
-            split_idx = path.rfind('.')
-            import_path = path[:split_idx]
-            class_name = path[split_idx + 1:]
-            module = importlib.import_module(import_path)
-            class_ = getattr(module, class_name)
-            obj = class_(**curr_params)
+            obj = _resolve_class(path)(**curr_params)
 
-        return copy.deepcopy(obj)
+        # obj was constructed right here, so there is no aliasing to defend against
+        return obj
 
     def create_loss_function(self, name, params):
         """
@@ -340,13 +351,11 @@ class WrapperTensorFlow:
                         if param_value is not None:
                             curr_params[param] = param_value
 
-                split_idx = path.rfind('.')
-                import_path = path[:split_idx]
-                class_name = path[split_idx + 1:]
-                module = importlib.import_module(import_path)
-                loss = getattr(module, class_name)
+                loss = _resolve_class(path)
 
                 if curr_params is None:
                     curr_params = dict()
 
-        return copy.deepcopy(loss), copy.deepcopy(curr_params)
\ No newline at end of file
+        # The class reference is shared by design and curr_params was built fresh above;
+        # a shallow copy of the params is all a caller could ever need
+        return loss, dict(curr_params) if curr_params is not None else None
\ No newline at end of file
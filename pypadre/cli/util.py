@@ -40,8 +40,7 @@ def _print_class_table(ctx, clz, *args, **kwargs):
 
 
 def _create_experiment_file(path=None, file_name=None):
-    if not os.path.exists(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
     _path = path + '/' + file_name + '.py'
     try:
         with open(_path,"w") as f:
@@ -1,3 +1,5 @@
+import os
+import time
 import uuid
 from abc import ABCMeta, abstractmethod
 
@@ -37,6 +39,20 @@ Enum for the different phases of an experiment
 exp_events = _ExperimentEvents()
 
 
+def _uuid7():
+    """
+    Time-ordered UUID (version 7): 48 bit unix millisecond timestamp followed by random
+    bits. Ids generated in sequence therefore sort chronologically, which keeps the
+    directories the file backends derive from them in creation order.
+    """
+    value = (int(time.time() * 1000) & 0xffffffffffff) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    # Stamp version 7 and the RFC 4122 variant over the random bits
+    value = (value & ~(0xf << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
 class MetadataMixin(ModelHolderMixin, Tablefyable):
     __metaclass__ = ABCMeta
     """
@@ -60,9 +76,7 @@ class MetadataMixin(ModelHolderMixin, Tablefyable):
     @abstractmethod
     def __init__(self, *, metadata: dict, **kwargs):
 
-        import time
-
-        metadata = {**{"id": uuid.uuid4().__str__(), self.CREATED_AT: time.time(), self.UPDATED_AT: time.time()},
+        metadata = {**{"id": _uuid7().__str__(), self.CREATED_AT: time.time(), self.UPDATED_AT: time.time()},
                     **metadata}
 
         super().__init__(**{"metadata": metadata, **kwargs})
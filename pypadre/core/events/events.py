@@ -227,12 +227,16 @@ class Signaler(SuperStop):
         if condition:
             if len(sender) == 0:
                 sender = [cls]
-            if signal.name not in cls.signals():
+            # Resolve the signal with a single lookup; the membership test plus get
+            # doubled the dict work on every send
+            resolved = cls.signals().get(signal.name)
+            if resolved is None:
                 # Try to add missing signals
                 init_class_signals(cls)
-                if signal.name not in cls.signals():
+                resolved = cls.signals().get(signal.name)
+                if resolved is None:
                     raise ValueError("Signal is not existing on " + str(cls))
-            cls.signals().get(signal.name).send(*sender, signal=signal, **kwargs)
+            resolved.send(*sender, signal=signal, **kwargs)
 
     def send_signal(self, signal: SignalSchema, *sender, condition=True, **kwargs):
         if len(sender) == 0:
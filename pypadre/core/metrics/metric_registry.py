@@ -10,9 +10,8 @@ from pypadre.core.model.generic.i_model_mixins import LoggableMixin
 class MetricRegistry(LoggableMixin):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-
-    registered_providers = DiGraph()
-    providers_by_consumption = {}
+        self.registered_providers = DiGraph()
+        self.providers_by_consumption = {}
 
     def get_provider_by_name(self, name):
         pass
@@ -32,17 +31,15 @@ class MetricRegistry(LoggableMixin):
                     self.registered_providers.add_edge(node, provider)
                 if node.consumes in provider.provides:
                     self.registered_providers.add_edge(provider, node)
-            if not hasattr(self.providers_by_consumption, provider.consumes):
+            if provider.consumes not in self.providers_by_consumption:
                 self.providers_by_consumption[provider.consumes] = [provider]
             else:
                 self.providers_by_consumption[provider.consumes].append(provider)
 
     def initial_providers(self, computation: Computation):
-        entries = []
-        for node in self.registered_providers.nodes:
-            if node.consumes == computation.format:
-                entries.append(node)
-        return entries
+        # The compatibility between formats and providers is fixed at registration time,
+        # so the lookup table built in add_provider replaces a scan over all nodes here
+        return list(self.providers_by_consumption.get(computation.format, []))
 
     def available_providers(self, computation: Computation) -> Set[MetricProviderMixin]:
         metric_providers = set()
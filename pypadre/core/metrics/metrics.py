@@ -1,6 +1,7 @@
 
 # Class to calculate some kind of metric on a component result or dataset
 from abc import ABCMeta, abstractmethod
+from types import GeneratorType
 from typing import List
 
 from pypadre.core.model.computation.computation import Computation
@@ -20,6 +21,11 @@ class Metric(Computation):
     NAME = "name"
 
     def __init__(self, *, name, computation, result, **kwargs):
+        # Materialize generator results once here so the backends can always
+        # persist them instead of silently skipping the results file
+        if isinstance(result, GeneratorType):
+            result = list(result)
+
         # Add defaults
         defaults = {}
 
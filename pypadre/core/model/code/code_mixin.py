@@ -227,13 +227,18 @@ class PythonPackage(CodeMixin):
         """
         self._variable = variable
         self._package = package
+        # Cache for the resolved variable. The package / variable combination is static, so the import machinery
+        # only has to be hit once instead of on every call.
+        self._resolved = None
         metadata = {**{self.PACKAGE: self._package, self.VARIABLE: self._variable,
                        "id": persistent_hash((self._variable, self._package, repository_identifier.id_hash()))},
                     **kwargs.pop("metadata", {})}
         super().__init__(repository_identifier=repository_identifier, type=self._CodeType.package, metadata=metadata, **kwargs)
 
     def _call(self, ctx, **kwargs):
-        variable = getattr(importlib.import_module(self._package), self._variable)
+        variable = self._resolved
+        if variable is None:
+            variable = self._resolved = getattr(importlib.import_module(self._package), self._variable)
         if isinstance(variable, Callable):
             return variable(ctx, **kwargs)
         elif isinstance(variable, ExecuteableMixin):
@@ -258,6 +263,7 @@ class PythonFile(CodeMixin):
         self._variable = variable
         self._package = package
         self._path = path
+        self._resolved = None
         metadata = {**{self.PACKAGE: self._package, self.VARIABLE: self._variable, self.PATH: self._path,
                        "id": persistent_hash((self._variable, self._package, self._path, repository_identifier.id_hash()))},
                     **kwargs.pop("metadata", {})}
@@ -272,11 +278,13 @@ class PythonFile(CodeMixin):
             return execfile(self._path, glob=globals, loc=locals)
 
         # Else append to import path and then import like a normal python package
-        import sys
-        import os
-        sys.path.append(os.path.abspath(self._path))
+        variable = self._resolved
+        if variable is None:
+            import sys
+            import os
+            sys.path.append(os.path.abspath(self._path))
 
-        variable = getattr(importlib.import_module(self._package), self._variable)
+            variable = self._resolved = getattr(importlib.import_module(self._package), self._variable)
         if isinstance(variable, Callable):
             return variable(ctx, **kwargs)
         elif isinstance(variable, ExecuteableMixin):
@@ -8,9 +8,7 @@ class HyperParameterGrid(Computation):
         self._parameter_names = kwargs.pop('parameter_names', None)
 
     def iter_result(self):
+        # The result is the raw itertools.product iterator; keep streaming it and
+        # pair names with values directly instead of indexing via a range
         for element in self._result:
-            execution_params = dict()
-            for param, idx in zip(self._parameter_names, range(0, len(self._parameter_names))):
-                execution_params[param] = element[idx]
-
-            yield execution_params
+            yield dict(zip(self._parameter_names, element))
@@ -25,6 +25,11 @@ class NumpyContainer(IBaseContainer, LoggableMixin):
         assert set(self._features_idx).isdisjoint(set(self._targets_idx)) and \
                set(self._features_idx).union(set(self._targets_idx)) == set([idx for idx in range(len(self._attributes))])
 
+        # The underlying binary is fixed after construction, so the fancy-indexed feature and
+        # target slices are computed at most once and reused on every access.
+        self._features_cache = None
+        self._targets_cache = None
+
 
     @property
     def attributes(self):
@@ -34,15 +39,17 @@ class NumpyContainer(IBaseContainer, LoggableMixin):
     def features(self):
         if self._features_idx is None:
             return self._data
-        else:
-            return self._data[:, self._features_idx]
+        if self._features_cache is None:
+            self._features_cache = self._data[:, self._features_idx]
+        return self._features_cache
 
     @property
     def targets(self):
         if self._targets_idx is None:
             return None
-        else:
-            return self._data[:, self._targets_idx]
+        if self._targets_cache is None:
+            self._targets_cache = self._data[:, self._targets_idx]
+        return self._targets_cache
 
     @property
     def data(self):
@@ -22,8 +22,6 @@ class Execution(CodeManagedMixin, StoreableMixin, ProgressableMixin, Validateabl
     EXPERIMENT_ID = "experiment_id"
     EXPERIMENT_NAME = "experiment_name"
 
-    _runs = []
-
     @classmethod
     def _tablefy_register_columns(cls):
         super()._tablefy_register_columns()
@@ -42,8 +40,8 @@ class Execution(CodeManagedMixin, StoreableMixin, ProgressableMixin, Validateabl
             **metadata}
         super().__init__(parent=experiment, model_clz=execution_model, metadata=metadata, **kwargs)
 
-        if runs is not None:
-            self._runs = runs
+        # The run list is per execution; a class-level default would alias runs across all instances
+        self._runs = runs if runs is not None else []
 
         self._pipeline = pipeline
 
@@ -1,8 +1,30 @@
+import itertools
+
 from pypadre._package import PACKAGE_ID
 from pypadre.core.model.code.code_mixin import PythonPackage, Function
 from pypadre.core.model.pipeline.parameter_providers.parameters import ParameterProvider
 
 
+class LazyGrid:
+    """
+    Re-iterable cartesian product over the hyperparameter value lists. Iteration
+    streams fresh tuples in O(1) memory while __length_hint__ exposes the grid
+    size without materializing it.
+    """
+
+    def __init__(self, factors):
+        self._factors = [tuple(factor) for factor in factors]
+
+    def __iter__(self):
+        return itertools.product(*self._factors)
+
+    def __length_hint__(self):
+        size = 1
+        for factor in self._factors:
+            size *= len(factor)
+        return size
+
+
 def _create_combinations(ctx, **parameters: dict):
     """
     Creates all the possible combinations of hyper parameters passed
@@ -10,8 +32,6 @@ def _create_combinations(ctx, **parameters: dict):
     :return: A list containing all the combinations and a list containing the hyperparameter names
     """
 
-    import itertools
-
     params_list = []
     master_list = []
 
@@ -30,7 +50,7 @@ def _create_combinations(ctx, **parameters: dict):
         params_list.append(parameter)
 
     # Create the grid
-    grid = itertools.product(*master_list)
+    grid = LazyGrid(master_list)
     return grid, params_list
 
 
@@ -18,24 +18,15 @@ class ParameterMap:
 
     def get_for(self, component):
         parameters = self.get(component.id)
-        if len(parameters.keys()) == 0:
-            if component.name in self._keys:
-                return self.map.get(component.name)
-
-            # Return empty dict
-            return dict()
+        if parameters:
+            return parameters
+        # Fall back to a lookup by name
+        return self.get(component.name)
 
     def get(self, identifier):
-        if identifier in self._keys:
-            return self.map.get(identifier)
-        return dict()
-
-    @property
-    def _keys(self):
         if self.map is None:
-            return []
-
-        return list(self.map.keys())
+            return dict()
+        return self.map.get(identifier, dict())
 
 
 class ParameterProviderMixin(CodeManagedMixin, CustomCodeHolder, SuperStop):
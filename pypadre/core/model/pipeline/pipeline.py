@@ -24,11 +24,17 @@ from pypadre.core.validation.validation import ValidateableMixin
 class Pipeline(CodeManagedMixin, ProgressableMixin, ExecuteableMixin, DiGraph, ValidateableMixin):
     def __init__(self, allow_metrics=True, **attr):
         self._allow_metrics = allow_metrics
+        self._hash_cache = None
         super().__init__(**attr)
 
     def hash(self):
         # TODO this has may have to include if the pipeline structure was changed etc
-        return persistent_hash(",".join([str(pc.id) for pc in self.nodes]))
+        # The md5-based persistent_hash is expensive, so it is memoized keyed on the node ids
+        # and only recomputed when the pipeline composition changes
+        node_ids = ",".join([str(pc.id) for pc in self.nodes])
+        if self._hash_cache is None or self._hash_cache[0] != node_ids:
+            self._hash_cache = (node_ids, persistent_hash(node_ids))
+        return self._hash_cache[1]
 
     def get_component(self, id):
         # TODO make this defensive
@@ -114,7 +120,6 @@ class Pipeline(CodeManagedMixin, ProgressableMixin, ExecuteableMixin, DiGraph, V
             available_message = "Following metrics would be available for " + str(computation) + " at node " + \
                                 computation.component.name + ": " + ', '.join(str(p) for p in available_metrics)
             self.send_info(message=available_message)
-            print(available_message)
 
         # calculate metrics
         if allow_metrics:
@@ -126,7 +131,6 @@ class Pipeline(CodeManagedMixin, ProgressableMixin, ExecuteableMixin, DiGraph, V
                               "on node {node}".format(metric=str(metric),
                                                       node=str(computation.component.name))
                     self.send_info(message=message)
-                    print(message)
             providers = providers if len(providers) > 0 else None
 
             metrics = metric_registry.calculate_measures(computation, run=run, node=node, providers=providers,
@@ -149,7 +153,6 @@ class Pipeline(CodeManagedMixin, ProgressableMixin, ExecuteableMixin, DiGraph, V
             output.send_put()
             message = "Calculating " + output.name + " done."
             self.send_info(message=message)
-            print(message)
 
     def _execute_successors(self, node: PipelineComponentMixin, *, data, parameter_map: ParameterMap, run: Run,
                             predecessor: Computation = None, metrics_map: MetricsMap, **kwargs):
@@ -56,7 +56,9 @@ def split(ctx, strategy="random", test_ratio=0.25, random_seed=None, val_ratio=0
     if random_seed is None:
         from pypadre.core.util.random import padre_seed
         random_seed = padre_seed
-    r = np.random.RandomState(random_seed)
+    # default_rng (PCG64) shuffles noticeably faster than the legacy RandomState
+    # and avoids touching any global seeding state
+    r = np.random.default_rng(random_seed)
     idx = np.arange(n)
 
     def splitting_iterator():
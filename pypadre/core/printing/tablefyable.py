@@ -90,9 +90,15 @@ class Tablefyable(SuperStop):
         :return:
         """
         self.__class__._tablefy_check_init()
-        return [get_dict_attr(self, value)(self) if callable(get_dict_attr(self, value)) else
-                get_dict_attr(self, value).fget(self) for key, value in registry[self.__class__.__name__].items()
-                if len(args) == 0 or len(args) >= 1 and key in args]
+        row = []
+        for key, value in registry[self.__class__.__name__].items():
+            if args and key not in args:
+                continue
+            # Resolve the attribute once per column instead of once for the
+            # callable check and again for the call
+            attr = get_dict_attr(self, value)
+            row.append(attr(self) if callable(attr) else attr.fget(self))
+        return row
 
     def __str__(self):
         self.__class__._tablefy_check_init()
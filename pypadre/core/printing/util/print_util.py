@@ -56,15 +56,51 @@ def get_default_table():
     return table
 
 
+class PlainTable:
+    """ Minimal stand-in for the part of the BeautifulTable API used by to_table.
+    BeautifulTable re-walks all cells on every append_row to recompute column widths,
+    which makes building big listings quadratic; this buffers the rows and computes
+    the widths in a single pass when rendering. """
+
+    def __init__(self):
+        self._headers = []
+        self._rows = []
+
+    @property
+    def column_headers(self):
+        return self._headers
+
+    @column_headers.setter
+    def column_headers(self, headers):
+        self._headers = [str(h) for h in headers]
+
+    def append_row(self, row):
+        self._rows.append([str(cell) for cell in row])
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __str__(self):
+        widths = [len(h) for h in self._headers]
+        for row in self._rows:
+            for i, cell in enumerate(row):
+                if len(cell) > widths[i]:
+                    widths[i] = len(cell)
+        fmt = "  ".join("{:<%d}" % w for w in widths)
+        lines = [fmt.format(*self._headers), "-" * (sum(widths) + 2 * (len(widths) - 1))]
+        lines.extend(fmt.format(*row) for row in self._rows)
+        return "\n".join(lines)
+
+
 def to_table(clz, objects: Union[Tablefyable, List[Tablefyable]], columns=None, table=None, spinner=False,
-             print_empty=True):
+             print_empty=True, rich=True):
     if clz is None:
         if objects:
             if not isinstance(objects, List):
                 objects = [objects]
             clz = objects[0].__class__
     if table is None:
-        table = get_default_table()
+        table = get_default_table() if rich else PlainTable()
     if columns is None:
         table.column_headers = clz.tablefy_header()
     else:
@@ -72,13 +108,14 @@ def to_table(clz, objects: Union[Tablefyable, List[Tablefyable]], columns=None,
     if spinner:
         spinner = Spinner()
         spinner.start()
+    # BeautifulTable stringifies cells itself, so rows can be appended as-is
+    headers = table.column_headers
     for obj in objects:
-        table.append_row(
-            [str(x) for x in obj.tablefy_to_row(*table.column_headers)])
+        table.append_row(obj.tablefy_to_row(*headers))
     if spinner:
         spinner.stop()
     if print_empty and len(table) == 0:
-        table.append_row([str("-") for x in table.column_headers])
+        table.append_row(["-" for _ in headers])
     return table
 
 # def print_dicts_as_table(dicts, separate_head=True, heads=None):
@@ -20,7 +20,8 @@ class _Const:
         self.__dict__[name]=value
 
 
-def get_sys_info():
+@functools.lru_cache(maxsize=1)
+def _collect_sys_info():
     # TODO: Implement the gathering of system information as dynamic code
     # TODO: Remove hard coded strings.
     # This function collects all system related info in a dictionary
@@ -35,6 +36,12 @@ def get_sys_info():
     return sys_info
 
 
+def get_sys_info():
+    # The platform queries are static per process; callers get a fresh copy so the
+    # cached dict cannot be mutated from outside
+    return dict(_collect_sys_info())
+
+
 def _merge_dict_class_vars(clz, clz_var:str, limit_clz):
     var = dict()
     for pclz in clz.mro():
@@ -108,6 +115,7 @@ def persistent_hash(to_hash, algorithm=hashlib.md5):
     return int(algorithm(to_hash.encode("utf-8")).hexdigest(), 16)
 
 
+@functools.lru_cache(maxsize=None)
 def find_package_structure(package_path):
     package_path, file_extension = os.path.splitext(package_path)
 
@@ -16,13 +16,14 @@ version_mappings = {}
 #supported_frameworks = ['scikit-learn', 'pytorch']
 
 path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../binding/resources/mapping"))
-mapping_files = os.listdir(path)
 
-# For every file verify whether it is a json file and then add to the current type_mappings and name_mappings
-for file in mapping_files:
-    if os.path.isfile(os.path.join(path,file)) and file.endswith(".json"):
+# For every file verify whether it is a json file and then add to the current type_mappings and name_mappings.
+# scandir caches the file type per entry, saving a stat call compared to listdir + isfile.
+for entry in os.scandir(path):
+    if entry.is_file() and entry.name.endswith(".json"):
+        file = entry.name
         try:
-            with open(os.path.join(path,file), encoding='utf-8-sig') as f:
+            with open(entry.path, encoding='utf-8-sig') as f:
                 data = json.loads(f.read())
                 algorithms = data['algorithms']
                 metadata = data['metadata']
@@ -65,3 +66,7 @@ for package in packages:
 
 
 supported_frameworks = list(version_mappings.keys())
+
+# Names of all algorithms typed as classifiers. Precomputed once so callers can use a set
+# membership test instead of fetching and comparing the type string of a mapping entry.
+classification_estimators = {name for name, alg in name_mappings.items() if alg.get('type') == 'Classification'}
@@ -65,9 +65,10 @@ class Visitor(abc.ABC):
         if type(template) is str:
             elements = template.split(".")
             last_element = elements[-1]
-            elements = elements[:-1]
             target_dict = result
-            for e in elements:
+            # Walk all but the last element by index instead of slicing a copy of the list
+            for i in range(len(elements) - 1):
+                e = elements[i]
                 if not e in target_dict:
                     target_dict[e] = {}
                 target_dict = target_dict[e]
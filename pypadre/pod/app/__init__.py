@@ -4,5 +4,5 @@ The package contains
 2.
 """
 
+from .config.padre_config import PadreConfig
 from .padre_app import PadreApp
-from .padre_app import PadreConfig
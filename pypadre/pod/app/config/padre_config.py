@@ -1,9 +1,21 @@
 import ast
 import configparser
 import os
+import re
 
 from pypadre.pod.util.dict_util import dict_merge
 
+# Lightweight ini parsing for __load_config. The stdlib ConfigParser builds interpolation
+# and proxy machinery we never use; a compiled section pattern plus str.partition covers
+# the simple section/key=value format of ~/.padre.cfg.
+_SECTION_PATTERN = re.compile(r"\[(?P<header>[^]]+)\]")
+_BOOLEAN_STATES = {'1': True, 'yes': True, 'true': True, 'on': True,
+                   '0': False, 'no': False, 'false': False, 'off': False}
+
+# expanduser hits the environment (and possibly pwd) each call; resolve the home
+# directory once since default() runs on every PadreConfig construction
+_HOME = os.path.expanduser("~")
+
 if "PADRE_BASE_URL" in os.environ:
     _BASE_URL = os.environ["PADRE_BASE_URL"]
 else:
@@ -12,10 +24,23 @@ else:
 if "PADRE_CFG_FILE" in os.environ:
     _PADRE_CFG_FILE = os.environ["PADRE_CFG_FILE"]
 else:
-    _PADRE_CFG_FILE = os.path.expanduser('~/.padre.cfg')
+    _PADRE_CFG_FILE = os.path.join(_HOME, '.padre.cfg')
 
 _GITLAB_BASE_URL = 'http://localhost:8080/'
 
+# Shared default template. default() hands out copies of the mutable parts only,
+# so the constant structure is not reallocated on every PadreConfig construction.
+_DEFAULT_CONFIG = {
+    "GENERAL": {
+        "offline": True,
+        "backends": [
+            {
+                "root_dir": os.path.join(_HOME, ".pypadre")
+            }
+        ]
+    }
+}
+
 
 class PadreConfig:
     """
@@ -62,12 +87,14 @@ class PadreConfig:
         :param config: Additional configuration
         """
         self._config = self.default()
+        self._loaded_mtime = None
+        # Memoizes get() lookups (notably the literal_eval of the backends entry)
+        self._get_cache = {}
 
         # handle file here
         self._config_file = config_file
         if self._config_file is not None:
-            self.__load_config()
-            if not os.path.exists(self._config_file) and create:
+            if not self.__load_config() and create:
                 self.save()
 
         # now merge
@@ -75,38 +102,62 @@ class PadreConfig:
         self.save()
 
     def __merge_config(self, to_merge):
-        # merges the provided dictionary into the config.
-        if to_merge is not None:
+        # merges the provided dictionary into the config. Skips empty input so
+        # dict_merge never walks the config for a no-op merge.
+        if to_merge:
             dict_merge(self._config, to_merge)
 
     def __load_config(self):
         """
         loads a padre configuration from the given file or from the standard file ~/.padre.cfg if no file is provided
         :param config_file: filename of config file
-        :return: config accessable as dictionary
+        :return: True if the config file existed
         """
-        config = configparser.ConfigParser()
-        if os.path.exists(self._config_file):
-            config.read(self._config_file)
-            config_data = dict(config._sections)
-            if config.has_option("GENERAL", "offline"):
-                config_data["GENERAL"]["offline"] = config.getboolean("GENERAL", "offline")
-            self.__merge_config(config_data)
+        # A single stat answers both the existence check and the change detection,
+        # avoiding the exists/read race and extra syscalls
+        try:
+            mtime = os.stat(self._config_file).st_mtime
+        except OSError:
+            return False
+
+        # Skip reparsing (and remerging) when the file has not changed since the last load
+        if mtime == self._loaded_mtime:
+            return True
+
+        config_data = {}
+        section = None
+        with open(self._config_file) as cfile:
+            for line in cfile:
+                line = line.strip()
+                if not line or line.startswith(('#', ';')):
+                    continue
+                match = _SECTION_PATTERN.match(line)
+                if match:
+                    section = config_data.setdefault(match.group("header"), {})
+                    continue
+                key, sep, value = line.partition('=')
+                if not sep:
+                    key, sep, value = line.partition(':')
+                if sep and section is not None:
+                    # ConfigParser lower-cases option names via optionxform; keep that behaviour
+                    section[key.strip().lower()] = value.strip()
+
+        offline = config_data.get("GENERAL", {}).get("offline")
+        if isinstance(offline, str):
+            if offline.lower() not in _BOOLEAN_STATES:
+                raise ValueError("Not a boolean: %s" % offline)
+            config_data["GENERAL"]["offline"] = _BOOLEAN_STATES[offline.lower()]
+        self.__merge_config(config_data)
+        self._loaded_mtime = mtime
+        return True
 
     def default(self):
         """
         :return: default values of the config
         """
-        return {
-            "GENERAL": {
-                "offline": True,
-                "backends": [
-                    {
-                        "root_dir": os.path.join(os.path.expanduser("~"), ".pypadre")
-                    }
-                ]
-            }
-        }
+        return {section: {key: [dict(entry) for entry in value] if key == "backends" else value
+                          for key, value in values.items()}
+                for section, values in _DEFAULT_CONFIG.items()}
 
     @property
     def config_file(self):
@@ -119,6 +170,7 @@ class PadreConfig:
     @config.setter
     def config(self, config):
         self._config = config
+        self._get_cache.clear()
 
     @property
     def general(self):
@@ -129,6 +181,7 @@ class PadreConfig:
         reloads the configuration specified under the current config path
         """
         self.__load_config()
+        self._get_cache.clear()
 
     def save(self) -> None:
         """
@@ -160,6 +213,7 @@ class PadreConfig:
         if not self.config[section]:
             self.config[section] = dict()
         self.config[section][key] = value
+        self._get_cache.clear()
 
     def has_entry(self, key, section='GENERAL'):
         try:
@@ -176,10 +230,15 @@ class PadreConfig:
         :type key: str
         :return: Found value or False
         """
+        if (section, key) in self._get_cache:
+            return self._get_cache[(section, key)]
         # TODO lists seem not be be supported in base config files of python. Don't hardcode
         if key == "backends":
-            return ast.literal_eval(self._config[section][key])
-        return self._config[section][key]
+            value = ast.literal_eval(self._config[section][key])
+        else:
+            value = self._config[section][key]
+        self._get_cache[(section, key)] = value
+        return value
 
     def get_list(self, key, section='GENERAL') -> list:
         """
@@ -34,22 +34,21 @@ class CoreApp(IBaseApp):
 
         # TODO Should each subApp really hold each backend? This may be convenient to code like this.
         #  self._logger = LoggingService(backends)
-        self._dataset_app = DatasetApp(self,
-                                       [backend.dataset for backend in backends] if backends is not None else None)
-        self._project_app = ProjectApp(self,
-                                       [backend.project for backend in backends] if backends is not None else None)
-        self._experiment_app = ExperimentApp(self, [backend.experiment for backend in
-                                                    backends] if backends is not None else None)
-        self._execution_app = ExecutionApp(self, [backend.execution for backend in
-                                                  backends] if backends is not None else None)
-        self._run_app = RunApp(self, [backend.run for backend in backends] if backends is not None else None)
-        self._split_app = SplitApp(self, [backend.split for backend in backends] if backends is not None else None)
-        self._computation_app = ComputationApp(self, [backend.computation for backend in
-                                                      backends] if backends is not None else None)
-        self._metric_app = MetricApp(self, [backend.metric for backend in backends] if backends is not None else None)
-        self._code_app = CodeApp(self, [backend.code for backend in backends] if backends is not None else None)
-        self._pipeline_output_app = PipelineOutputApp(self, [backend.pipeline_output for backend in
-                                                             backends] if backends is not None else None)
+        # The sub apps are created lazily on first access so that unused backends are never
+        # touched (constructing a backend repository can hit the file system or the network).
+        self._dataset_app = None
+        self._project_app = None
+        self._experiment_app = None
+        self._execution_app = None
+        self._run_app = None
+        self._split_app = None
+        self._computation_app = None
+        self._metric_app = None
+        self._code_app = None
+        self._pipeline_output_app = None
+
+    def _backend_repositories(self, name):
+        return [getattr(backend, name) for backend in self._backends] if self._backends is not None else None
 
     @property
     def backends(self):
@@ -57,40 +56,64 @@ class CoreApp(IBaseApp):
 
     @property
     def datasets(self):
+        if self._dataset_app is None:
+            self._dataset_app = DatasetApp(self, self._backend_repositories("dataset"))
         return self._dataset_app
 
     @property
     def projects(self):
+        if self._project_app is None:
+            self._project_app = ProjectApp(self, self._backend_repositories("project"))
         return self._project_app
 
     @property
     def experiments(self):
+        if self._experiment_app is None:
+            self._experiment_app = ExperimentApp(self, self._backend_repositories("experiment"))
         return self._experiment_app
 
     @property
     def executions(self):
+        if self._execution_app is None:
+            self._execution_app = ExecutionApp(self, self._backend_repositories("execution"))
         return self._execution_app
 
     @property
     def runs(self):
+        if self._run_app is None:
+            self._run_app = RunApp(self, self._backend_repositories("run"))
         return self._run_app
 
     @property
     def splits(self):
+        if self._split_app is None:
+            self._split_app = SplitApp(self, self._backend_repositories("split"))
         return self._split_app
 
     @property
     def computations(self):
+        if self._computation_app is None:
+            self._computation_app = ComputationApp(self, self._backend_repositories("computation"))
         return self._computation_app
 
     @property
     def metrics(self):
+        if self._metric_app is None:
+            self._metric_app = MetricApp(self, self._backend_repositories("metric"))
         return self._metric_app
 
     @property
     def code(self):
+        if self._code_app is None:
+            self._code_app = CodeApp(self, self._backend_repositories("code"))
         return self._code_app
 
+    @property
+    def pipeline_outputs(self):
+        if self._pipeline_output_app is None:
+            self._pipeline_output_app = PipelineOutputApp(self, self._backend_repositories("pipeline_output"))
+        return self._pipeline_output_app
+
     def has_print(self):
         return self._print is not None
 
@@ -99,7 +122,10 @@ class CoreApp(IBaseApp):
 
     def print_tables(self, clz, objects, **kwargs):
         self.print_("Loading " + clz.__name__ + " table...")
-        self.print_(to_table(clz, objects, **kwargs))
+        # The linear-time plain builder keeps big listings from going quadratic;
+        # column widths depend on all rows, so rendering stays one pass rather
+        # than streaming row by row
+        self.print_(to_table(clz, objects, rich=False, **kwargs))
 
     def print_(self, output, **kwargs):
         if self.has_print():
@@ -40,24 +40,26 @@ class PadreFileBackend(IPadreBackend):
     def log(self, message, **kwargs):
         if self._file is None:
             path = os.path.join(self.root_dir, "padre.log")
-            if not os.path.exists(self.root_dir):
-                os.makedirs(self.root_dir)
+            os.makedirs(self.root_dir, exist_ok=True)
 
             self._file = open(path, "a")
         self._file.write(message)
 
     def __init__(self, config):
         super().__init__(config)
-        self._dataset = DatasetFileRepository(self)
-        self._project = ProjectFileRepository(self)
-        self._experiment = ExperimentFileRepository(self)
-        self._execution = ExecutionFileRepository(self)
-        self._run = RunFileRepository(self)
-        self._split = SplitFileRepository(self)
-        self._computation = ComputationFileRepository(self)
-        self._metric = MetricFileRepository(self)
-        self._code = CodeFileRepository(self)
-        self._pipeline_output = PipelineOutputFileRepository(self)
+        # Repositories are created on first access. Constructing one touches the file
+        # system (and for some repositories git), which is wasted when the backend is
+        # only partially used.
+        self._dataset = None
+        self._project = None
+        self._experiment = None
+        self._execution = None
+        self._run = None
+        self._split = None
+        self._computation = None
+        self._metric = None
+        self._code = None
+        self._pipeline_output = None
 
         # logging
         self._file = None
@@ -71,40 +73,60 @@ class PadreFileBackend(IPadreBackend):
 
     @property
     def dataset(self) -> DatasetFileRepository:
+        if self._dataset is None:
+            self._dataset = DatasetFileRepository(self)
         return self._dataset
 
     @property
     def project(self) -> ProjectFileRepository:
+        if self._project is None:
+            self._project = ProjectFileRepository(self)
         return self._project
 
     @property
     def experiment(self) -> ExperimentFileRepository:
+        if self._experiment is None:
+            self._experiment = ExperimentFileRepository(self)
         return self._experiment
 
     @property
     def execution(self) -> ExecutionFileRepository:
+        if self._execution is None:
+            self._execution = ExecutionFileRepository(self)
         return self._execution
 
     @property
     def run(self) -> RunFileRepository:
+        if self._run is None:
+            self._run = RunFileRepository(self)
         return self._run
 
     @property
     def split(self) -> SplitFileRepository:
+        if self._split is None:
+            self._split = SplitFileRepository(self)
         return self._split
 
     @property
     def computation(self) -> IComputationRepository:
+        if self._computation is None:
+            self._computation = ComputationFileRepository(self)
         return self._computation
 
     @property
     def metric(self) -> IMetricRepository:
+        if self._metric is None:
+            self._metric = MetricFileRepository(self)
         return self._metric
 
     @property
     def code(self) -> ICodeRepository:
+        if self._code is None:
+            self._code = CodeFileRepository(self)
         return self._code
 
     @property
     def pipeline_output(self) -> IPipelineOutputRepository:
+        if self._pipeline_output is None:
+            self._pipeline_output = PipelineOutputFileRepository(self)
         return self._pipeline_output
@@ -32,8 +32,7 @@ class PadreGitLabBackend(IPadreBackend):
     def log(self, message, **kwargs):
         if self._file is None:
             path = os.path.join(self.root_dir, "padre.log")
-            if not os.path.exists(self.root_dir):
-                os.makedirs(self.root_dir)
+            os.makedirs(self.root_dir, exist_ok=True)
 
             self._file = open(path, "a")
 
@@ -41,56 +40,78 @@ class PadreGitLabBackend(IPadreBackend):
 
     def __init__(self, config):
         super().__init__(config)
-        self._project = ProjectGitlabRepository(self)
-        self._experiment = ExperimentGitlabRepository(self)
-        self._dataset = DatasetGitlabRepository(self)
-        self._execution = ExecutionGitlabRepository(self)
-        self._run = RunGitlabRepository(self)
-        self._split = SplitGitlabRepository(self)
-        self._computation = ComputationGitlabRepository(self)
-        self._metric = MetricGitlabRepository(self)
-        self._code = CodeGitlabRepository(self)
-        self._pipeline_output = PipelineOutputGitlabRepository(self)
+        # Repositories are created on first access so that an unused backend never
+        # opens a connection to the gitlab server.
+        self._project = None
+        self._experiment = None
+        self._dataset = None
+        self._execution = None
+        self._run = None
+        self._split = None
+        self._computation = None
+        self._metric = None
+        self._code = None
+        self._pipeline_output = None
 
         # logging
         self._file = None
 
     @property
     def project(self) -> IProjectRepository:
+        if self._project is None:
+            self._project = ProjectGitlabRepository(self)
         return self._project
 
     @property
     def experiment(self) -> IExperimentRepository:
+        if self._experiment is None:
+            self._experiment = ExperimentGitlabRepository(self)
         return self._experiment
 
     @property
     def dataset(self) -> IDatasetRepository:
+        if self._dataset is None:
+            self._dataset = DatasetGitlabRepository(self)
         return self._dataset
 
     @property
     def execution(self) -> ExecutionGitlabRepository:
+        if self._execution is None:
+            self._execution = ExecutionGitlabRepository(self)
         return self._execution
 
     @property
     def run(self) -> RunGitlabRepository:
+        if self._run is None:
+            self._run = RunGitlabRepository(self)
         return self._run
 
     @property
     def split(self) -> SplitGitlabRepository:
+        if self._split is None:
+            self._split = SplitGitlabRepository(self)
         return self._split
 
     @property
     def computation(self) -> IComputationRepository:
+        if self._computation is None:
+            self._computation = ComputationGitlabRepository(self)
         return self._computation
 
     @property
     def metric(self) -> IMetricRepository:
+        if self._metric is None:
+            self._metric = MetricGitlabRepository(self)
         return self._metric
 
     @property
     def code(self) -> ICodeRepository:
+        if self._code is None:
+            self._code = CodeGitlabRepository(self)
         return self._code
 
     @property
     def pipeline_output(self) -> IPipelineOutputRepository:
+        if self._pipeline_output is None:
+            self._pipeline_output = PipelineOutputGitlabRepository(self)
         return self._pipeline_output
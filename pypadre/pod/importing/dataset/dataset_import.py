@@ -27,6 +27,9 @@ class _Sources(_Const):
 
 sources = _Sources()
 
+# Compiled once; _split_description runs for every dataset loaded from a sklearn bunch
+_DESCR_NAME_PATTERN = re.compile(r"\.\. (.*):")
+
 
 class DataSetLoaderMixin(LoggableMixin):
     """
@@ -300,7 +303,7 @@ class SKLearnLoader(ICollectionDataSetLoader):
     @staticmethod
     def _split_description(s):
         # TODO get name of the dataset from somewhere else?
-        match = re.compile("\.\. (.*):").match(s)
+        match = _DESCR_NAME_PATTERN.match(s)
         if match:
             return match.group(1), s
         else:
@@ -410,11 +413,13 @@ class OpenMLLoader(DataSetLoaderMixin):
             for col_name in target_features:
                 df_data[col_name] = df_data[col_name].astype('category')
                 df_data[col_name] = df_data[col_name].cat.codes
+            target_set = set(target_features)
             atts = []
             for feature in df_data.columns.values:
+                is_target = feature in target_set
                 atts.append(Attribute(name=feature,
-                                      measurementLevel="Ratio" if feature in target_features else None,
-                                      defaultTargetAttribute=feature in target_features))
+                                      measurementLevel="Ratio" if is_target else None,
+                                      defaultTargetAttribute=is_target))
 
             meta = {**{"name": load.name,
                        "description": load.description,
@@ -39,9 +39,20 @@ class CodeFileRepository(IGitRepository, ICodeRepository):
 
     def __init__(self, backend: IPadreBackend):
         super().__init__(root_dir=os.path.join(backend.root_dir, NAME), backend=backend)
+        # Resolved directory paths keyed by the requested directory. Filled
+        # lazily on lookup and eagerly on put so repeated gets skip the glob.
+        self._path_cache = {}
+
+    def _resolve_dir(self, directory):
+        path = self._path_cache.get(directory)
+        if path is None:
+            # Only the first match is needed; iglob stops scanning as soon as it is found
+            path = next(glob.iglob(os.path.join(self._replace_placeholders_with_wildcard(self.root_dir), directory)))
+            self._path_cache[directory] = path
+        return path
 
     def _get_by_dir(self, directory):
-        path = glob.glob(os.path.join(self._replace_placeholders_with_wildcard(self.root_dir), directory))[0]
+        path = self._resolve_dir(directory)
 
         metadata = self.get_file(path, META_FILE)
 
@@ -69,11 +80,11 @@ class CodeFileRepository(IGitRepository, ICodeRepository):
 
         if metadata.get(CodeMixin.CODE_TYPE) == str(CodeMixin._CodeType.function):
             if root_dir is not None:
-                fn_dir = glob.glob(os.path.join(self._replace_placeholders_with_wildcard(root_dir),
-                                   os.path.abspath(os.path.join(directory, '..', 'function'))))[0]
+                fn_dir = next(glob.iglob(os.path.join(self._replace_placeholders_with_wildcard(root_dir),
+                                         os.path.abspath(os.path.join(directory, '..', 'function')))))
             else:
-                fn_dir = glob.glob(os.path.join(self._replace_placeholders_with_wildcard(self.root_dir),
-                                       os.path.abspath(os.path.join(directory, '..', 'function'))))[0]
+                fn_dir = next(glob.iglob(os.path.join(self._replace_placeholders_with_wildcard(self.root_dir),
+                                         os.path.abspath(os.path.join(directory, '..', 'function')))))
             fn = self.get_file(fn_dir, CODE_FILE)
             code = Function(fn=fn, metadata=metadata, repository_identifier=identifier)
 
@@ -104,11 +115,14 @@ class CodeFileRepository(IGitRepository, ICodeRepository):
     def _put(self, obj, *args, directory: str, **kwargs):
         code = obj
 
+        # The directory was just created, so lookups can resolve it without globbing
+        self._path_cache[directory] = directory
+
         if isinstance(code, Function):
             # TODO fn repository
-            if not os.path.exists(os.path.abspath(os.path.join(directory, '..', 'function'))):
-                os.mkdir(os.path.abspath(os.path.join(directory, '..', 'function')))
-            self.write_file(os.path.abspath(os.path.join(directory, '..', 'function')), CODE_FILE, code.fn, mode="wb")
+            fn_dir = os.path.abspath(os.path.join(directory, '..', 'function'))
+            os.makedirs(fn_dir, exist_ok=True)
+            self.write_file(fn_dir, CODE_FILE, code.fn, mode="wb")
 
         self.write_file(directory, META_FILE, code.metadata)
 
@@ -79,7 +79,7 @@ class DatasetFileRepository(IGitRepository, IDatasetRepository):
         visualization = json.loads(visualization)
         file_name = kwargs.pop("file_name", None)
         if file_name is not None:
-            file_name = file_name.split(".")[0] + ".json"
+            file_name = file_name.partition(".")[0] + ".json"
         else:
             file_name = "visualization.json"
         self.write_file(kwargs.pop("base_path"), File(file_name, JSonSerializer), visualization)
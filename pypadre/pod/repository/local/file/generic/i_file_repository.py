@@ -1,6 +1,9 @@
+import glob
 import os
+import re
 import shutil
 from abc import abstractmethod, ABCMeta
+from itertools import islice
 from logging import warning
 
 from cachetools import LRUCache, cached
@@ -13,6 +16,9 @@ from pypadre.pod.repository.exceptions import ObjectAlreadyExists
 from pypadre.pod.repository.generic.i_repository_mixins import IStoreableRepository, ISearchable, IRepository
 from pypadre.pod.util.file_util import get_path
 
+# Matches the {SOME_ID} placeholders the repositories splice into their root dirs
+_PLACEHOLDER_PATTERN = re.compile("{.*?}")
+
 
 class File:
     def __init__(self, name, serializer):
@@ -46,6 +52,8 @@ class IFileRepository(IRepository, ISearchable, IStoreableRepository):
     @abstractmethod
     def __init__(self, *, root_dir: str, backend: IPadreBackend, **kwargs):
         self.root_dir = root_dir
+        # The root dir is fixed, so its wildcard form only has to be built once
+        self._wildcard_root = _PLACEHOLDER_PATTERN.sub("*", root_dir)
         self._cache = LRUCache(maxsize=16)
         super().__init__(backend=backend, **kwargs)
 
@@ -84,11 +92,17 @@ class IFileRepository(IRepository, ISearchable, IStoreableRepository):
         """
         folder = None
         if search is not None and self.FOLDER_SEARCH in search:
-            folder = search.pop(self.FOLDER_SEARCH)
+            folder = search[self.FOLDER_SEARCH]
+            # Shallow copy instead of popping so the caller's search dict stays usable
+            # for the other backends it is passed to
+            search = {k: v for k, v in search.items() if k != self.FOLDER_SEARCH}
         dirs = self.find_dirs(folder)
         # TODO look into metadata file without loading the object to increase performance and filter sooner
-        # TODO add offset und size
-        return self.filter([self.get_by_dir(d) for d in dirs], search)
+        # Deserialize lazily so paging only loads the objects of the requested window
+        objects = (self.get_by_dir(d) for d in dirs)
+        if search:
+            objects = (o for o in objects if ISearchable.in_search(o, search))
+        return list(islice(objects, offset, offset + size))
 
     def delete_by_id(self, uid):
         """
@@ -121,14 +135,17 @@ class IFileRepository(IRepository, ISearchable, IStoreableRepository):
         """
         directory = self.to_directory(obj)
 
-        # Create or overwrite folder
-        if os.path.exists(directory):
+        # Create or overwrite folder. EAFP saves the extra stat syscall of an
+        # exists check for the common case of a new directory.
+        try:
+            os.makedirs(directory)
+        except FileExistsError:
             if not allow_overwrite:
                 raise ObjectAlreadyExists("Object path for {object} already exists at path:{path}. "
                                           "Overwriting is not explicitly allowed. "
                                           "Set allow_overwrite to True.".format(object=str(obj), path=directory))
             shutil.rmtree(directory)
-        os.makedirs(directory)
+            os.makedirs(directory)
 
         remove_cached(self._cache, obj.id)
 
@@ -302,12 +319,12 @@ class IFileRepository(IRepository, ISearchable, IStoreableRepository):
         return path.replace(self.placeholder(), self.to_folder_name(obj))
 
     def _replace_placeholders_with_wildcard(self, path):
-        import re
-        return re.sub("{.*?}", "*", path)
+        if path == self.root_dir:
+            return self._wildcard_root
+        return _PLACEHOLDER_PATTERN.sub("*", path)
 
     def _get_all_dirs(self):
-        import glob
-        return glob.glob(self._replace_placeholders_with_wildcard(self.root_dir) + "/*/")
+        return glob.glob(self._wildcard_root + "/*/")
 
 
 # TODO Maybe we could simplify the file repository by having all of them on root level. We don't need to use submodules and therefore can cope without the structure when using git tsrc
@@ -40,10 +40,10 @@ class IGitRepository(IFileRepository):
         directory = self.to_directory(obj)
         if not repo_exists(directory):
             repo = Repo.init(path=directory, **kwargs.pop("repo_kwargs", {}))
-            add_and_commit(directory, message=kwargs.pop('message', 'Initial Commit of Repository'))
+            add_and_commit(directory, message=kwargs.pop('message', 'Initial Commit of Repository'), repo=repo)
         else:
             repo = get_repo(path=directory, **kwargs.pop("repo_kwargs", {}))
-            add_and_commit(directory, message=kwargs.pop('message', 'Commiting existing changes'))
+            add_and_commit(directory, message=kwargs.pop('message', 'Commiting existing changes'), repo=repo)
 
         return repo
 
@@ -46,11 +46,11 @@ class ILogFileRepository(IFileRepository, ILogRepository):
 
     def log(self, message, **kwargs):
         if self._file is None:
-            path = os.path.join(self.root_dir, "padre.log")
-            if not os.path.exists(self.root_dir):
-                os.makedirs(self.root_dir)
+            path = os.path.join(self.root_dir, FILE_NAME)
+            os.makedirs(self.root_dir, exist_ok=True)
 
-            self._file = open(path, "a")
+            # Line buffering coalesces each entry into a single write instead of
+            # paying an explicit flush syscall per logged message
+            self._file = open(path, "a", buffering=1)
         self._file.write(message)
-        self._file.flush()
 
@@ -1,5 +1,4 @@
 import os
-from types import GeneratorType
 
 from pypadre.core.metrics.metrics import Metric
 from pypadre.pod.backend.i_padre_backend import IPadreBackend
@@ -38,5 +37,6 @@ class MetricFileRepository(IChildFileRepository, ILogFileRepository, IMetricRepo
     def _put(self, obj, *args, directory: str, merge=False, **kwargs):
         metric = obj
         self.write_file(directory, META_FILE, metric.metadata)
-        if not isinstance(metric.result, GeneratorType):
-            self.write_file(directory, RESULT_FILE, metric.result)
+        # Metric materializes generator results on construction, so the result
+        # is always writable here
+        self.write_file(directory, RESULT_FILE, metric.result)
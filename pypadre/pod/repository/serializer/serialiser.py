@@ -22,7 +22,7 @@ class PickleSerializer(Serializer):
         :param obj: object to serialise
         :return: byte object (TODO: Specify more precise)
         """
-        return pickle.dumps(obj)
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
 
     @staticmethod
     def deserialize(buffer):
@@ -46,7 +46,9 @@ class DillSerializer(Serializer):
         :param obj: object to serialise
         :return: byte object (TODO: Specify more precise)
         """
-        return dill.dumps(obj)
+        # The highest protocol serializes large buffers without the copies the
+        # default (backwards compatible) protocol incurs; loads is protocol agnostic
+        return dill.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
 
     @staticmethod
     def deserialize(buffer):
@@ -62,7 +64,9 @@ class JSonSerializer(Serializer):
 
     @staticmethod
     def serialise(obj):
-        return json.dumps(obj)
+        # Compact separators shrink the metadata files the git layer then has to
+        # hash and pack, at no cost to parseability
+        return json.dumps(obj, separators=(',', ':'))
 
     @staticmethod
     def deserialize(buffer):
@@ -17,7 +17,9 @@ class ServiceMixin:
     @abstractmethod
     def __init__(self, backends, *args, **kwargs):
         b = backends if isinstance(backends, List) else [backends]
-        self._backends = [] if backends is None else b
+        # Backends are fixed after construction; a tuple makes that explicit and
+        # gives the per-event dispatch loops an immutable snapshot to iterate
+        self._backends = () if backends is None else tuple(b)
 
     @property
     def backends(self):
@@ -45,7 +47,13 @@ class CrudServiceMixin(ServiceMixin):
         for b in self.backends:
             backend: ISearchable = b
             # TODO here the first backend takes priority can we change that?
-            [entities.append(e) for e in backend.list(search=search, offset=offset, size=size) if len(entities) < size and e not in entities]
+            if len(entities) >= size:
+                break
+            for e in backend.list(search=search, offset=offset, size=size):
+                if len(entities) >= size:
+                    break
+                if e not in entities:
+                    entities.append(e)
         return entities
 
     def put(self, obj, **kwargs):
@@ -77,13 +85,7 @@ class CrudServiceMixin(ServiceMixin):
         :param uid: Id of the entity to get
         :return: Entity
         """
-        obj_list = []
-        for b in self.backends:
-            backend: IStoreableRepository = b
-            obj = backend.get(uid)
-            if obj is not None:
-                obj_list.append(obj)
-        return obj_list
+        return [obj for obj in (b.get(uid) for b in self.backends) if obj is not None]
 
     def get_by_hash(self, hash):
         """
@@ -91,13 +93,7 @@ class CrudServiceMixin(ServiceMixin):
         :param hash: Id of the entity to get
         :return: Entity
         """
-        obj_list = []
-        for b in self.backends:
-            backend: IStoreableRepository = b
-            obj = backend.get_by_hash(hash)
-            if obj is not None:
-                obj_list.append(obj)
-        return obj_list
+        return [obj for obj in (b.get_by_hash(hash) for b in self.backends) if obj is not None]
 
     def delete(self, obj):
         """
@@ -1,19 +1,30 @@
+from collections.abc import Mapping
+
+
 def dict_merge(dct, merge_dct):
-    """ Recursive dict merge. Inspired by :meth:``dict.update()``, instead of
-    updating only top-level keys, dict_merge recurses down into dicts nested
+    """ Iterative dict merge. Inspired by :meth:``dict.update()``, instead of
+    updating only top-level keys, dict_merge descends into dicts nested
     to an arbitrary depth, updating keys. The ``merge_dct`` is merged into
     ``dct``.
     :param dct: dict onto which the merge is executed
     :param merge_dct: dct merged into dct
     :return: None
     """
-    import collections
-    for k, v in merge_dct.items():
-        if (k in dct and isinstance(dct[k], dict)
-                and isinstance(merge_dct[k], collections.Mapping)):
-            dict_merge(dct[k], merge_dct[k])
-        else:
-            dct[k] = merge_dct[k]
+    # Nothing to do for empty input or a self merge
+    if not merge_dct or merge_dct is dct:
+        return
+    # An explicit stack avoids a Python function call per nesting level. The exact
+    # type check is the fast path; isinstance only runs for Mapping subclasses.
+    stack = [(dct, merge_dct)]
+    while stack:
+        target, source = stack.pop()
+        for k, v in source.items():
+            existing = target.get(k)
+            if (type(existing) is dict or isinstance(existing, dict)) \
+                    and (type(v) is dict or isinstance(v, Mapping)):
+                stack.append((existing, v))
+            else:
+                target[k] = v
 
 
 def get_dict_attr(obj, attr):
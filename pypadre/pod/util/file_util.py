@@ -4,6 +4,6 @@ import os
 def get_path(root_dir, name, create=True):
     # internal get or create path function
     _dir = os.path.expanduser(os.path.join(root_dir, name))
-    if not os.path.exists(_dir) and create:
-        os.makedirs(_dir)
+    if create:
+        os.makedirs(_dir, exist_ok=True)
     return _dir
\ No newline at end of file
@@ -50,7 +50,9 @@ def commit(repo, message):
     :param message: Message when committing
     :return:
     """
-    repo.git.commit(message=message)
+    # index.commit writes the tree and ref in-process; repo.git.commit forks a
+    # git subprocess for every stored object
+    repo.index.commit(message)
 
 
 def create_sub_module(repo, sub_repo_name, path_to_sub_repo, url, branch='master'):
@@ -302,22 +304,28 @@ def get_repo(path=None, url=None, **kwargs):
 
 
 def crawl_repo(repo, rpath, _path=""):
-    rpath = rpath.split('/')
-    path = _path + '/' + rpath.pop(0) if _path!="" else rpath.pop(0)
+    # partition yields head and rest in one go instead of split + pop(0),
+    # which shifts the whole list and forces a re-join for the recursion
+    head, _, rest = rpath.partition('/')
+    path = _path + '/' + head if _path != "" else head
     repository_tree = repo.repository_tree(path=path)
     paths = [obj.get('path') for obj in repository_tree]
-    if len(rpath) > 0:
+    if rest:
         _paths = []
         for _path in paths:
-            _paths += crawl_repo(repo, '/'.join(rpath), _path=_path)
+            _paths += crawl_repo(repo, rest, _path=_path)
         return _paths
     else:
         return paths
 
 
-def add_and_commit(dir_path, message=DEFAULT_GIT_MSG, force_commit=False):
-    repo = create_repo(path=dir_path, bare=False) if not repo_exists(dir_path) else get_repo(path=dir_path)
+def add_and_commit(dir_path, message=DEFAULT_GIT_MSG, force_commit=False, repo=None):
+    # Callers holding the repo already can pass it in to avoid reopening it
+    if repo is None:
+        repo = create_repo(path=dir_path, bare=False) if not repo_exists(dir_path) else get_repo(path=dir_path)
     add_untracked_files(repo=repo)
-    if len(repo.index.diff(None)) > 0 or not repo.active_branch.is_valid() or force_commit or len(
-            repo.index.diff("master")) > 0:
+    # Cheap checks first: the flag and branch state cost nothing, while each
+    # index diff walks the repository state
+    if force_commit or not repo.active_branch.is_valid() or len(repo.index.diff(None)) > 0 \
+            or len(repo.index.diff("master")) > 0:
         commit(repo, message=message)
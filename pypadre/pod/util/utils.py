@@ -17,8 +17,7 @@ class ResourceDirectory:
     def create_directory(self):
         # TODO create a corresponding configuration object. look up best practices
         data_dir = os.path.expanduser(RESOURCE_DIRECTORY_PATH)
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir)
+        os.makedirs(data_dir, exist_ok=True)
         return data_dir
 
 